@@ -7,7 +7,7 @@ https://github.com/sosandstrom/custom_appliance
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import Platform
 from homeassistant.loader import async_get_loaded_integration
@@ -26,6 +26,24 @@ PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
 ]
 
+# Settings missing from older entries, ApplianceConfig defaults apply
+_OPTIONAL_SETTINGS = ("power_epsilon", "time_in_state_publish_interval")
+
+
+def _build_appliance_config(config: dict[str, Any]) -> ApplianceConfig:
+    """Build an appliance configuration from config entry data."""
+    # Positional arguments, in ApplianceConfig field order
+    return ApplianceConfig(
+        config["name"],
+        config["power_sensor_entity_id"],
+        config.get("area_id"),
+        config["off_threshold"],
+        config["running_threshold"],
+        config["debounce_time"],
+        config["complete_timeout"],
+        **{key: config[key] for key in _OPTIONAL_SETTINGS if key in config},
+    )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,15 +53,7 @@ async def async_setup_entry(
     # Parse appliances from config data
     appliances_data = entry.data.get("appliances", {})
     appliances = {
-        appliance_id: ApplianceConfig(
-            name=config["name"],
-            power_sensor_entity_id=config["power_sensor_entity_id"],
-            area_id=config.get("area_id"),
-            off_threshold=config["off_threshold"],
-            running_threshold=config["running_threshold"],
-            debounce_time=config["debounce_time"],
-            complete_timeout=config["complete_timeout"],
-        )
+        appliance_id: _build_appliance_config(config)
         for appliance_id, config in appliances_data.items()
     }
 
@@ -86,24 +96,44 @@ async def async_reload_entry(
     # Parse new appliances configuration
     appliances_data = entry.data.get("appliances", {})
     new_appliances = {
-        appliance_id: ApplianceConfig(
-            name=config["name"],
-            power_sensor_entity_id=config["power_sensor_entity_id"],
-            area_id=config.get("area_id"),
-            off_threshold=config["off_threshold"],
-            running_threshold=config["running_threshold"],
-            debounce_time=config["debounce_time"],
-            complete_timeout=config["complete_timeout"],
-        )
+        appliance_id: _build_appliance_config(config)
         for appliance_id, config in appliances_data.items()
     }
 
-    # Update coordinator with new appliances
+    # Diff against the running configuration
+    old_appliances = entry.runtime_data.appliances
+    added = {
+        appliance_id: config
+        for appliance_id, config in new_appliances.items()
+        if appliance_id not in old_appliances
+    }
+    changed = {
+        appliance_id: config
+        for appliance_id, config in new_appliances.items()
+        if appliance_id in old_appliances and old_appliances[appliance_id] != config
+    }
+    removed = old_appliances.keys() - new_appliances.keys()
+
+    # Entities and devices only need rebuilding when appliances are added or
+    # removed, or when the device name or area changes
+    if (
+        added
+        or removed
+        or any(
+            config.name != old_appliances[appliance_id].name
+            or config.area_id != old_appliances[appliance_id].area_id
+            for appliance_id, config in changed.items()
+        )
+    ):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    if not changed:
+        return
+
+    # Update coordinator with the changed appliances only
     coordinator = entry.runtime_data.coordinator
-    await coordinator.async_update_appliances(new_appliances)
+    await coordinator.async_apply_diff({}, changed, set())
 
     # Update runtime data
     entry.runtime_data.appliances = new_appliances
-
-    # Reload the entry to refresh entities
-    await hass.config_entries.async_reload(entry.entry_id)
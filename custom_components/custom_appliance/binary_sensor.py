@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from itertools import product
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -42,19 +43,18 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary sensor platform."""
     coordinator = entry.runtime_data.coordinator
+    appliance_ids = coordinator.get_appliance_ids()
 
-    entities = []
-    for appliance_id in coordinator.get_appliance_ids():
-        for description in BINARY_SENSOR_DESCRIPTIONS:
-            entities.append(
-                CustomApplianceBinarySensor(
-                    coordinator=coordinator,
-                    appliance_id=appliance_id,
-                    entity_description=description,
-                )
-            )
-
-    async_add_entities(entities)
+    async_add_entities(
+        CustomApplianceBinarySensor(
+            coordinator=coordinator,
+            appliance_id=appliance_id,
+            entity_description=description,
+        )
+        for appliance_id, description in product(
+            appliance_ids, BINARY_SENSOR_DESCRIPTIONS
+        )
+    )
 
 
 class CustomApplianceBinarySensor(CustomApplianceEntity, BinarySensorEntity):
@@ -74,7 +74,8 @@ class CustomApplianceBinarySensor(CustomApplianceEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if not self.appliance_data:
+        appliance_data = self.appliance_data
+        if not appliance_data:
             return None
 
-        return self.appliance_data.get(self.entity_description.key, False)
+        return appliance_data[self._entity_key]
@@ -2,15 +2,53 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import area_registry as ar, entity_registry as er, selector
 
-from .const import DOMAIN
+from .const import DOMAIN, POWER_EPS, TIME_IN_STATE_PUBLISH_INTERVAL
+
+_POWER_SENSOR_RE = re.compile(r"power|watt", re.IGNORECASE)
+
+# Validators shared by every appliance form
+_OFF_THRESHOLD_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0.0, max=100.0))
+_RUNNING_THRESHOLD_VALIDATOR = vol.All(
+    vol.Coerce(float), vol.Range(min=1.0, max=5000.0)
+)
+_DEBOUNCE_TIME_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=10, max=600))
+_COMPLETE_TIMEOUT_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=60, max=3600))
+_POWER_EPSILON_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0.0, max=100.0))
+_PUBLISH_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=3600))
+
+# Options flow step handling each action of the init menu
+_ACTION_STEPS: dict[str, str] = {
+    "add": "async_step_add_appliance",
+    "edit": "async_step_select_appliance",
+    "delete": "async_step_delete_appliance",
+}
+
+
+def _get_power_sensors(hass: HomeAssistant) -> list[str]:
+    """Get entity IDs of sensors that look like power sensors."""
+    entity_registry = er.async_get(hass)
+    return [
+        entity_id
+        for entity_id in entity_registry.entities
+        if entity_id.startswith("sensor.") and _POWER_SENSOR_RE.search(entity_id)
+    ]
+
+
+def _get_areas(hass: HomeAssistant) -> list[dict[str, str]]:
+    """Get selector options for all areas."""
+    area_registry = ar.async_get(hass)
+    return [
+        {"value": area.id, "label": area.name} for area in area_registry.areas.values()
+    ]
 
 
 class CustomApplianceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -34,6 +72,10 @@ class CustomApplianceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "running_threshold": user_input["running_threshold"],
                     "debounce_time": user_input["debounce_time"],
                     "complete_timeout": user_input["complete_timeout"],
+                    "power_epsilon": user_input["power_epsilon"],
+                    "time_in_state_publish_interval": user_input[
+                        "time_in_state_publish_interval"
+                    ],
                 }
             }
 
@@ -42,24 +84,9 @@ class CustomApplianceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data={"appliances": appliances},
             )
 
-        # Get available power sensors
-        entity_registry = er.async_get(self.hass)
-        power_sensors = [
-            entity.entity_id
-            for entity in entity_registry.entities.values()
-            if entity.entity_id.startswith("sensor.")
-            and (
-                "power" in entity.entity_id.lower()
-                or "watt" in entity.entity_id.lower()
-            )
-        ]
-
-        # Get available areas
-        area_registry = ar.async_get(self.hass)
-        areas = [
-            {"value": area.id, "label": area.name}
-            for area in area_registry.areas.values()
-        ]
+        # Get available power sensors and areas
+        power_sensors = _get_power_sensors(self.hass)
+        areas = _get_areas(self.hass)
 
         return self.async_show_form(
             step_id="user",
@@ -78,18 +105,23 @@ class CustomApplianceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             mode=selector.SelectSelectorMode.DROPDOWN,
                         )
                     ),
-                    vol.Required("off_threshold", default=5.0): vol.All(
-                        vol.Coerce(float), vol.Range(min=0.0, max=100.0)
-                    ),
-                    vol.Required("running_threshold", default=50.0): vol.All(
-                        vol.Coerce(float), vol.Range(min=1.0, max=5000.0)
-                    ),
-                    vol.Required("debounce_time", default=60): vol.All(
-                        vol.Coerce(int), vol.Range(min=10, max=600)
-                    ),
-                    vol.Required("complete_timeout", default=300): vol.All(
-                        vol.Coerce(int), vol.Range(min=60, max=3600)
-                    ),
+                    vol.Required(
+                        "off_threshold", default=5.0
+                    ): _OFF_THRESHOLD_VALIDATOR,
+                    vol.Required(
+                        "running_threshold", default=50.0
+                    ): _RUNNING_THRESHOLD_VALIDATOR,
+                    vol.Required("debounce_time", default=60): _DEBOUNCE_TIME_VALIDATOR,
+                    vol.Required(
+                        "complete_timeout", default=300
+                    ): _COMPLETE_TIMEOUT_VALIDATOR,
+                    vol.Required(
+                        "power_epsilon", default=POWER_EPS
+                    ): _POWER_EPSILON_VALIDATOR,
+                    vol.Required(
+                        "time_in_state_publish_interval",
+                        default=TIME_IN_STATE_PUBLISH_INTERVAL,
+                    ): _PUBLISH_INTERVAL_VALIDATOR,
                 }
             ),
             description_placeholders={
@@ -113,18 +145,20 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         """Initialize options flow."""
         self.config_entry = config_entry
         self._appliances: dict[str, dict] = config_entry.data.get("appliances", {})
+        self._power_sensor_selector: selector.SelectSelector | None = None
+        self._area_selector: selector.SelectSelector | None = None
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage appliances."""
         if user_input is not None:
-            if user_input["action"] == "add":
-                return await self.async_step_add_appliance()
-            if user_input["action"] == "edit":
-                return await self.async_step_select_appliance()
-            if user_input["action"] == "delete":
-                return await self.async_step_delete_appliance()
+            try:
+                step = _ACTION_STEPS[user_input["action"]]
+            except KeyError:
+                pass
+            else:
+                return await getattr(self, step)()
 
         appliances_list = [
             f"{config['name']} ({config['power_sensor_entity_id']})"
@@ -175,6 +209,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 "running_threshold": user_input["running_threshold"],
                 "debounce_time": user_input["debounce_time"],
                 "complete_timeout": user_input["complete_timeout"],
+                "power_epsilon": user_input["power_epsilon"],
+                "time_in_state_publish_interval": user_input[
+                    "time_in_state_publish_interval"
+                ],
             }
 
             return self.async_create_entry(
@@ -227,6 +265,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 "running_threshold": user_input["running_threshold"],
                 "debounce_time": user_input["debounce_time"],
                 "complete_timeout": user_input["complete_timeout"],
+                "power_epsilon": user_input["power_epsilon"],
+                "time_in_state_publish_interval": user_input[
+                    "time_in_state_publish_interval"
+                ],
             }
 
             return self.async_create_entry(
@@ -246,6 +288,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     "running_threshold": current_config["running_threshold"],
                     "debounce_time": current_config["debounce_time"],
                     "complete_timeout": current_config["complete_timeout"],
+                    "power_epsilon": current_config.get("power_epsilon", POWER_EPS),
+                    "time_in_state_publish_interval": current_config.get(
+                        "time_in_state_publish_interval",
+                        TIME_IN_STATE_PUBLISH_INTERVAL,
+                    ),
                 }
             ),
         )
@@ -287,55 +334,49 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if defaults is None:
             defaults = {}
 
-        # Get available power sensors
-        entity_registry = er.async_get(self.hass)
-        power_sensors = [
-            entity.entity_id
-            for entity in entity_registry.entities.values()
-            if entity.entity_id.startswith("sensor.")
-            and (
-                "power" in entity.entity_id.lower()
-                or "watt" in entity.entity_id.lower()
+        # Build the power sensor and area selectors once per options flow
+        if self._power_sensor_selector is None:
+            self._power_sensor_selector = selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=_get_power_sensors(self.hass),
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            )
+        if self._area_selector is None:
+            self._area_selector = selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=_get_areas(self.hass),
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
             )
-        ]
-
-        # Get available areas
-        area_registry = ar.async_get(self.hass)
-        areas = [
-            {"value": area.id, "label": area.name}
-            for area in area_registry.areas.values()
-        ]
 
         return vol.Schema(
             {
                 vol.Required("name", default=defaults.get("name", "My Appliance")): str,
                 vol.Required(
                     "power_sensor", default=defaults.get("power_sensor")
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=power_sensors,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Optional(
-                    "area", default=defaults.get("area")
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=areas,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
+                ): self._power_sensor_selector,
+                vol.Optional("area", default=defaults.get("area")): self._area_selector,
                 vol.Required(
                     "off_threshold", default=defaults.get("off_threshold", 5.0)
-                ): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=100.0)),
+                ): _OFF_THRESHOLD_VALIDATOR,
                 vol.Required(
                     "running_threshold", default=defaults.get("running_threshold", 50.0)
-                ): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=5000.0)),
+                ): _RUNNING_THRESHOLD_VALIDATOR,
                 vol.Required(
                     "debounce_time", default=defaults.get("debounce_time", 60)
-                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=600)),
+                ): _DEBOUNCE_TIME_VALIDATOR,
                 vol.Required(
                     "complete_timeout", default=defaults.get("complete_timeout", 300)
-                ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
+                ): _COMPLETE_TIMEOUT_VALIDATOR,
+                vol.Required(
+                    "power_epsilon", default=defaults.get("power_epsilon", POWER_EPS)
+                ): _POWER_EPSILON_VALIDATOR,
+                vol.Required(
+                    "time_in_state_publish_interval",
+                    default=defaults.get(
+                        "time_in_state_publish_interval", TIME_IN_STATE_PUBLISH_INTERVAL
+                    ),
+                ): _PUBLISH_INTERVAL_VALIDATOR,
             }
         )
@@ -6,3 +6,10 @@ LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "custom_appliance"
 ATTRIBUTION = "Data provided by http://jsonplaceholder.typicode.com/"
+
+# Power changes smaller than this (in watts) skip the state machine
+POWER_EPS = 0.5
+
+# Entities skip state writes unless the state changes or time in state
+# enters a new interval of this many seconds
+TIME_IN_STATE_PUBLISH_INTERVAL = 10
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import Event, HomeAssistant, callback
@@ -13,6 +14,8 @@ from .const import DOMAIN
 from .state_machine import CustomApplianceStateMachine
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, KeysView, Mapping
+
     from .data import ApplianceConfig, CustomApplianceConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,25 +40,85 @@ class ApplianceDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
 
         self._appliances = appliances
+        self._appliances_view = MappingProxyType(appliances)
         self._state_machines: dict[str, CustomApplianceStateMachine] = {}
         self._unsubscribe_listeners: list[callable] = []
+        self._sensor_to_single_appliance: dict[str, str] = {}
+        self._sensor_to_multi: dict[str, list[str]] = {}
+        self._unique_power_sensors: frozenset[str] = frozenset()
+        self._last_raw_state: dict[str, str] = {}
 
         # Initialize state machines for each appliance
         for appliance_id, config in appliances.items():
             self._state_machines[appliance_id] = CustomApplianceStateMachine(config)
 
+        # Persistent coordinator data, updated only for appliances that change
+        self._data: dict[str, Any] = {
+            appliance_id: state_machine.get_state_data()
+            for appliance_id, state_machine in self._state_machines.items()
+        }
+
         # Set up listeners for power sensor changes
-        self._setup_power_sensor_listeners()
+        self._setup_power_sensor_listeners(self._build_sensor_index())
+
+    def _build_sensor_index(self) -> frozenset[str]:
+        """
+        Index appliances by power sensor so events resolve with a lookup.
+
+        Sensors used by a single appliance, the common case, are kept apart
+        from shared sensors. Returns the unique power sensor entity IDs.
+        """
+        sensor_to_appliance_ids: dict[str, list[str]] = {}
+        for appliance_id, config in self._appliances.items():
+            sensor_to_appliance_ids.setdefault(
+                config.power_sensor_entity_id, []
+            ).append(appliance_id)
+
+        self._sensor_to_single_appliance = {
+            sensor_id: appliance_ids[0]
+            for sensor_id, appliance_ids in sensor_to_appliance_ids.items()
+            if len(appliance_ids) == 1
+        }
+        self._sensor_to_multi = {
+            sensor_id: appliance_ids
+            for sensor_id, appliance_ids in sensor_to_appliance_ids.items()
+            if len(appliance_ids) > 1
+        }
+        return frozenset(sensor_to_appliance_ids)
+
+    @callback
+    def _setup_power_sensor_listeners(
+        self, power_sensors: frozenset[str], *, validate: bool = True
+    ) -> None:
+        """
+        Set up listeners for power sensor state changes.
+
+        With validate set to False, only sensors that were not already
+        being listened to are validated.
+        """
+        previous_sensors = self._unique_power_sensors
+        self._unique_power_sensors = power_sensors
+
+        # Set up the listener
+        unsubscribe = async_track_state_change_event(
+            self.hass,
+            power_sensors,
+            self._handle_power_sensor_change,
+        )
+        self._unsubscribe_listeners.append(unsubscribe)
 
-    def _setup_power_sensor_listeners(self) -> None:
-        """Set up listeners for power sensor state changes."""
-        # Get all unique power sensor entity IDs
-        power_sensors = list(
-            {config.power_sensor_entity_id for config in self._appliances.values()}
+        # Verify sensors exist in the background, off the setup path
+        self.hass.async_create_task(
+            self._validate_power_sensors(
+                power_sensors if validate else power_sensors - previous_sensors
+            ),
+            f"{DOMAIN} validate power sensors",
+            eager_start=False,
         )
 
-        # Verify sensors exist
-        for sensor_id in power_sensors:
+    async def _validate_power_sensors(self, sensors: Iterable[str]) -> None:
+        """Warn about power sensors that are missing or not numeric."""
+        for sensor_id in sensors:
             state = self.hass.states.get(sensor_id)
             if state is None:
                 _LOGGER.warning("Power sensor %s not found", sensor_id)
@@ -69,14 +132,6 @@ class ApplianceDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     "Power sensor %s has non-numeric state: %s", sensor_id, state.state
                 )
 
-        # Set up the listener
-        unsubscribe = async_track_state_change_event(
-            self.hass,
-            power_sensors,
-            self._handle_power_sensor_change,
-        )
-        self._unsubscribe_listeners.append(unsubscribe)
-
     @callback
     def _handle_power_sensor_change(self, event: Event) -> None:
         """Handle power sensor state changes."""
@@ -86,61 +141,98 @@ class ApplianceDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if new_state is None:
             return
 
+        # Skip events where only attributes changed, unless an appliance on
+        # this sensor is waiting on a timeout or debounce to pass
+        raw_state = new_state.state
+        unchanged = self._last_raw_state.get(entity_id) == raw_state
+        if unchanged and not self._sensor_transition_may_be_due(entity_id):
+            return
+        self._last_raw_state[entity_id] = raw_state
+
         try:
-            power_value = float(new_state.state)
+            power_value = float(raw_state)
         except (ValueError, TypeError):
-            _LOGGER.warning(
-                "Invalid power reading from %s: %s", entity_id, new_state.state
+            _LOGGER.warning("Invalid power reading from %s: %s", entity_id, raw_state)
+            return
+
+        # Fast path for a sensor used by a single appliance
+        appliance_id = self._sensor_to_single_appliance.get(entity_id)
+        if appliance_id is not None:
+            state_machine = self._state_machines[appliance_id]
+            if not state_machine.update_power(power_value):
+                return
+            _LOGGER.debug(
+                "Appliance %s state changed to %s (power: %.2fW)",
+                state_machine.config.name,
+                state_machine.state_name,
+                power_value,
             )
+            self._data[appliance_id] = state_machine.get_state_data()
+            self.async_set_updated_data(self._data)
             return
 
-        # Update all appliances that use this power sensor
-        state_changed = False
-        for appliance_id, config in self._appliances.items():
-            if config.power_sensor_entity_id == entity_id:
-                state_machine = self._state_machines[appliance_id]
-                if state_machine.update_power(power_value):
-                    state_changed = True
-                    _LOGGER.debug(
-                        "Appliance %s state changed to %s (power: %.2fW)",
-                        config.name,
-                        state_machine.state_name,
-                        power_value,
-                    )
-
-        # Trigger coordinator update if any state changed
-        if state_changed:
-            self.async_set_updated_data(self._get_coordinator_data())
+        # Update all appliances that share this power sensor
+        updates: list[str] = []
+        for appliance_id in self._sensor_to_multi.get(entity_id, ()):
+            state_machine = self._state_machines[appliance_id]
+            if state_machine.update_power(power_value):
+                updates.append(appliance_id)
+                _LOGGER.debug(
+                    "Appliance %s state changed to %s (power: %.2fW)",
+                    state_machine.config.name,
+                    state_machine.state_name,
+                    power_value,
+                )
+
+        if not updates:
+            return
+
+        # Trigger a single coordinator update for all changed appliances
+        state_machines = self._state_machines
+        for appliance_id in updates:
+            self._data[appliance_id] = state_machines[appliance_id].get_state_data()
+        self.async_set_updated_data(self._data)
+
+    def _sensor_transition_may_be_due(self, entity_id: str) -> bool:
+        """Return True if an appliance on the sensor may change state over time."""
+        appliance_id = self._sensor_to_single_appliance.get(entity_id)
+        if appliance_id is not None:
+            return self._state_machines[appliance_id].transition_may_be_due
+        return any(
+            self._state_machines[appliance_id].transition_may_be_due
+            for appliance_id in self._sensor_to_multi.get(entity_id, ())
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from appliances."""
-        return self._get_coordinator_data()
+        return self._data
 
-    def _get_coordinator_data(self) -> dict[str, Any]:
-        """Get current data from all state machines."""
-        data = {}
-        for appliance_id, state_machine in self._state_machines.items():
-            data[appliance_id] = state_machine.get_state_data()
-        return data
+    @callback
+    def _load_current_power(self, appliance_id: str) -> None:
+        """Feed the current power sensor reading to an appliance state machine."""
+        state_machine = self._state_machines[appliance_id]
+        config = state_machine.config
+        power_sensor_state = self.hass.states.get(config.power_sensor_entity_id)
+        if power_sensor_state is not None:
+            try:
+                power_value = float(power_sensor_state.state)
+                state_machine.update_power(power_value)
+            except (ValueError, TypeError):
+                _LOGGER.warning(
+                    "Initial power reading for %s is invalid: %s",
+                    config.name,
+                    power_sensor_state.state,
+                )
+        self._data[appliance_id] = state_machine.get_state_data()
 
     async def async_setup(self) -> None:
         """Set up the coordinator."""
         # Initial data load - get current power readings
-        for appliance_id, config in self._appliances.items():
-            power_sensor_state = self.hass.states.get(config.power_sensor_entity_id)
-            if power_sensor_state is not None:
-                try:
-                    power_value = float(power_sensor_state.state)
-                    self._state_machines[appliance_id].update_power(power_value)
-                except (ValueError, TypeError):
-                    _LOGGER.warning(
-                        "Initial power reading for %s is invalid: %s",
-                        config.name,
-                        power_sensor_state.state,
-                    )
+        for appliance_id in self._appliances:
+            self._load_current_power(appliance_id)
 
         # Set initial data
-        self.async_set_updated_data(self._get_coordinator_data())
+        self.async_set_updated_data(self._data)
 
     async def async_shutdown(self) -> None:
         """Shut down the coordinator."""
@@ -149,6 +241,11 @@ class ApplianceDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             unsubscribe()
         self._unsubscribe_listeners.clear()
 
+    @property
+    def appliances(self) -> Mapping[str, ApplianceConfig]:
+        """Return a read-only view of appliance configurations by appliance ID."""
+        return self._appliances_view
+
     def get_appliance_config(self, appliance_id: str) -> ApplianceConfig | None:
         """Get appliance configuration."""
         return self._appliances.get(appliance_id)
@@ -159,39 +256,61 @@ class ApplianceDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Get state machine for appliance."""
         return self._state_machines.get(appliance_id)
 
-    def get_appliance_ids(self) -> list[str]:
-        """Get list of all appliance IDs."""
-        return list(self._appliances.keys())
+    def get_appliance_ids(self) -> KeysView[str]:
+        """Get a view of all appliance IDs."""
+        return self._appliances.keys()
 
-    async def async_update_appliances(
-        self, new_appliances: dict[str, ApplianceConfig]
+    async def async_apply_diff(
+        self,
+        added: dict[str, ApplianceConfig],
+        changed: dict[str, ApplianceConfig],
+        removed: set[str],
     ) -> None:
-        """Update appliances configuration."""
+        """Apply added, changed and removed appliances to the coordinator."""
+        # Update appliances
+        appliances = {
+            appliance_id: config
+            for appliance_id, config in self._appliances.items()
+            if appliance_id not in removed
+        }
+        appliances.update(changed)
+        appliances.update(added)
+        self._appliances = appliances
+        self._appliances_view = MappingProxyType(appliances)
+
+        # Remove state machines for deleted appliances
+        for removed_id in removed:
+            self._state_machines.pop(removed_id, None)
+            self._data.pop(removed_id, None)
+
+        # Update existing state machine config
+        for appliance_id, config in changed.items():
+            self._state_machines[appliance_id].config = config
+
+        # Create state machines for new appliances
+        for appliance_id, config in added.items():
+            self._state_machines[appliance_id] = CustomApplianceStateMachine(config)
+
+        power_sensors = self._build_sensor_index()
+
+        # Keep the current subscription when the set of sensors is unchanged
+        if power_sensors == self._unique_power_sensors:
+            for appliance_id in (*changed, *added):
+                self._load_current_power(appliance_id)
+            self.async_set_updated_data(self._data)
+            return
+
+        # Forget readings of sensors that are no longer used
+        for sensor_id in self._unique_power_sensors - power_sensors:
+            self._last_raw_state.pop(sensor_id, None)
+
         # Clean up old listeners
         for unsubscribe in self._unsubscribe_listeners:
             unsubscribe()
         self._unsubscribe_listeners.clear()
 
-        # Update appliances and state machines
-        self._appliances = new_appliances
-
-        # Remove state machines for deleted appliances
-        current_ids = set(self._state_machines.keys())
-        new_ids = set(new_appliances.keys())
-        for removed_id in current_ids - new_ids:
-            del self._state_machines[removed_id]
-
-        # Add/update state machines for current appliances
-        for appliance_id, config in new_appliances.items():
-            if appliance_id in self._state_machines:
-                # Update existing state machine config
-                self._state_machines[appliance_id].config = config
-            else:
-                # Create new state machine
-                self._state_machines[appliance_id] = CustomApplianceStateMachine(config)
-
-        # Set up new listeners
-        self._setup_power_sensor_listeners()
+        # Set up new listeners, validating only newly referenced sensors
+        self._setup_power_sensor_listeners(power_sensors, validate=False)
 
         # Update data
         await self.async_setup()
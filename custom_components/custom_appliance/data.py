@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from .const import POWER_EPS, TIME_IN_STATE_PUBLISH_INTERVAL
+
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
@@ -15,7 +17,7 @@ if TYPE_CHECKING:
 type CustomApplianceConfigEntry = ConfigEntry[CustomApplianceData]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ApplianceConfig:
     """Configuration for a single appliance."""
 
@@ -26,9 +28,11 @@ class ApplianceConfig:
     running_threshold: float
     debounce_time: int
     complete_timeout: int
+    power_epsilon: float = POWER_EPS
+    time_in_state_publish_interval: int = TIME_IN_STATE_PUBLISH_INTERVAL
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomApplianceData:
     """Data for the Custom Appliance integration."""
 
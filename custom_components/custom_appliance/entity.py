@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -25,8 +26,9 @@ class CustomApplianceEntity(CoordinatorEntity[ApplianceDataUpdateCoordinator]):
         super().__init__(coordinator)
         self._appliance_id = appliance_id
         self._entity_key = entity_key
+        self._last_published: tuple[str, float, int] | None = None
 
-        config = coordinator.get_appliance_config(appliance_id)
+        config = coordinator.appliances.get(appliance_id)
         if config is None:
             raise ValueError(f"Appliance {appliance_id} not found")
 
@@ -52,11 +54,30 @@ class CustomApplianceEntity(CoordinatorEntity[ApplianceDataUpdateCoordinator]):
         if config.area_id:
             self._attr_device_info["suggested_area"] = config.area_id
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Handle updated data from the coordinator.
+
+        The state is only written when the appliance state or power changes,
+        or time in state enters a new publish interval.
+        """
+        data = self.appliance_data
+        config = self.coordinator.appliances.get(self._appliance_id)
+        if data is not None and config is not None:
+            published = (
+                data["state"],
+                data["power"],
+                data["time_in_state"] // config.time_in_state_publish_interval,
+            )
+            if published == self._last_published:
+                return
+            self._last_published = published
+
+        super()._handle_coordinator_update()
+
     @property
     def appliance_data(self) -> dict[str, any] | None:
         """Get appliance data from coordinator."""
-        return (
-            self.coordinator.data.get(self._appliance_id)
-            if self.coordinator.data
-            else None
-        )
+        data = self.coordinator.data
+        return data.get(self._appliance_id) if data is not None else None
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from itertools import product
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -10,8 +11,10 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfPower, UnitOfTime
+from homeassistant.const import Platform, UnitOfPower
+from homeassistant.helpers import entity_registry as er
 
+from .const import DOMAIN
 from .entity import CustomApplianceEntity
 
 if TYPE_CHECKING:
@@ -22,12 +25,8 @@ if TYPE_CHECKING:
     from .data import CustomApplianceConfigEntry
 
 
+# State and time in state are exposed as attributes of the power sensor
 SENSOR_DESCRIPTIONS = (
-    SensorEntityDescription(
-        key="state",
-        name="State",
-        icon="mdi:state-machine",
-    ),
     SensorEntityDescription(
         key="power",
         name="Power",
@@ -36,41 +35,48 @@ SENSOR_DESCRIPTIONS = (
         native_unit_of_measurement=UnitOfPower.WATT,
         icon="mdi:flash",
     ),
-    SensorEntityDescription(
-        key="time_in_state",
-        name="Time in State",
-        device_class=SensorDeviceClass.DURATION,
-        native_unit_of_measurement=UnitOfTime.SECONDS,
-        icon="mdi:timer",
-    ),
 )
 
+# Keys of sensors replaced by attributes of the power sensor
+REMOVED_SENSOR_KEYS = ("state", "time_in_state")
+
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    hass: HomeAssistant,
     entry: CustomApplianceConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
     coordinator = entry.runtime_data.coordinator
-
-    entities = []
-    for appliance_id in coordinator.get_appliance_ids():
-        for description in SENSOR_DESCRIPTIONS:
-            entities.append(
-                CustomApplianceSensor(
-                    coordinator=coordinator,
-                    appliance_id=appliance_id,
-                    entity_description=description,
-                )
-            )
-
-    async_add_entities(entities)
+    appliance_ids = coordinator.get_appliance_ids()
+
+    # Remove sensors left in the entity registry by earlier versions
+    entity_registry = er.async_get(hass)
+    for appliance_id, key in product(appliance_ids, REMOVED_SENSOR_KEYS):
+        entity_id = entity_registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"{entry.entry_id}_{appliance_id}_{key}"
+        )
+        if entity_id is not None:
+            entity_registry.async_remove(entity_id)
+
+    async_add_entities(
+        CustomApplianceSensor(
+            coordinator=coordinator,
+            appliance_id=appliance_id,
+            entity_description=description,
+        )
+        for appliance_id, description in product(appliance_ids, SENSOR_DESCRIPTIONS)
+    )
 
 
 class CustomApplianceSensor(CustomApplianceEntity, SensorEntity):
     """Custom appliance sensor class."""
 
+    # Attributes that change on every write are kept out of the recorder
+    _unrecorded_attributes = frozenset(
+        {"time_in_state", "last_power_update", "last_state_change"}
+    )
+
     def __init__(
         self,
         coordinator: ApplianceDataUpdateCoordinator,
@@ -85,7 +91,13 @@ class CustomApplianceSensor(CustomApplianceEntity, SensorEntity):
     @property
     def native_value(self) -> str | float | int | None:
         """Return the native value of the sensor."""
-        if not self.appliance_data:
+        appliance_data = self.appliance_data
+        if not appliance_data:
             return None
 
-        return self.appliance_data.get(self.entity_description.key)
+        return appliance_data[self._entity_key]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the appliance state data as attributes."""
+        return self.appliance_data
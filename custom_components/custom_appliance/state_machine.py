@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .data import ApplianceConfig
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,18 +25,167 @@ class ApplianceState(Enum):
     COMPLETE = "complete"
 
 
+# Minimum seconds between negative power warnings for an appliance
+_NEGATIVE_POWER_WARN_INTERVAL = 60.0
+
+# States whose next transition depends on elapsed time rather than power
+_PENDING_TIMEOUT_STATES = frozenset({ApplianceState.RUNNING, ApplianceState.COMPLETE})
+
+
+def _from_inactive(
+    power: float,
+    _elapsed_s: float,
+    off_thr: float,
+    run_thr: float,
+    _debounce_s: float,
+    _complete_s: float,
+) -> ApplianceState:
+    """Return the next state when the appliance is off or idle."""
+    if power <= off_thr:
+        return ApplianceState.OFF
+    if power >= run_thr:
+        return ApplianceState.RUNNING
+    return ApplianceState.IDLE
+
+
+def _from_running(
+    power: float,
+    elapsed_s: float,
+    off_thr: float,
+    run_thr: float,
+    debounce_s: float,
+    _complete_s: float,
+) -> ApplianceState:
+    """Return the next state when the appliance is running."""
+    if power <= off_thr:
+        return ApplianceState.OFF
+    if power >= run_thr:
+        return ApplianceState.RUNNING
+    # Power dropped between thresholds, complete once debounced
+    if elapsed_s >= debounce_s:
+        return ApplianceState.COMPLETE
+    return ApplianceState.IDLE
+
+
+def _from_complete(
+    power: float,
+    elapsed_s: float,
+    off_thr: float,
+    run_thr: float,
+    _debounce_s: float,
+    complete_s: float,
+) -> ApplianceState:
+    """Return the next state when the appliance has completed a cycle."""
+    if power <= off_thr:
+        return ApplianceState.OFF
+    if power >= run_thr:
+        return ApplianceState.RUNNING
+    # Stay in complete state for the timeout period
+    if elapsed_s >= complete_s:
+        return ApplianceState.IDLE
+    return ApplianceState.COMPLETE
+
+
+# Next-state handler for each current state
+_NEXT_STATE_HANDLERS: dict[
+    ApplianceState,
+    Callable[[float, float, float, float, float, float], ApplianceState],
+] = {
+    ApplianceState.OFF: _from_inactive,
+    ApplianceState.IDLE: _from_inactive,
+    ApplianceState.RUNNING: _from_running,
+    ApplianceState.COMPLETE: _from_complete,
+}
+
+
+def _next_state(  # noqa: PLR0913
+    current: ApplianceState,
+    power: float,
+    elapsed_s: float,
+    off_thr: float,
+    run_thr: float,
+    debounce_s: float,
+    complete_s: float,
+) -> ApplianceState:
+    """
+    Return the state an appliance should move to.
+
+    Pure function of the current state, the power reading, the seconds spent
+    in the current state and the appliance thresholds and timings.
+    """
+    return _NEXT_STATE_HANDLERS[current](
+        power, elapsed_s, off_thr, run_thr, debounce_s, complete_s
+    )
+
+
 class CustomApplianceStateMachine:
     """State machine for custom appliance based on power consumption patterns."""
 
+    __slots__ = (
+        "_cache_dirty",
+        "_complete_timeout_s",
+        "_config",
+        "_debounce_s",
+        "_is_complete",
+        "_is_idle",
+        "_is_off",
+        "_is_running",
+        "_last_neg_warn_mono",
+        "_last_power_update_iso",
+        "_last_power_update_iso_mono",
+        "_last_power_update_mono",
+        "_last_state_change_iso",
+        "_off",
+        "_power_eps",
+        "_previous_state",
+        "_run",
+        "_state_data_cache",
+        "_state_entry_mono",
+        "_state_name",
+        "_transition_pending",
+        "current_state",
+        "last_power_reading",
+        "last_state_change",
+        "state_entry_time",
+    )
+
     def __init__(self, config: ApplianceConfig) -> None:
         """Initialize the state machine."""
         self.config = config
         self.current_state = ApplianceState.OFF
-        self.last_state_change = datetime.now()
+        now = time.monotonic()
+        wall_now = datetime.now()
+        self.last_state_change = wall_now
         self.last_power_reading = 0.0
-        self.last_power_update = datetime.now()
-        self.state_entry_time = datetime.now()
+        self._last_power_update_mono = now
+        self.state_entry_time = wall_now
+        self._state_entry_mono = now
         self._previous_state = ApplianceState.OFF
+        self._last_state_change_iso = wall_now.isoformat()
+        self._last_power_update_iso = self._last_state_change_iso
+        self._last_power_update_iso_mono = now
+        self._state_data_cache: dict[str, Any] | None = None
+        self._cache_dirty = True
+        self._transition_pending = False
+        self._last_neg_warn_mono = float("-inf")
+        self._cache_state_flags()
+
+    @property
+    def config(self) -> ApplianceConfig:
+        """Return the appliance configuration."""
+        return self._config
+
+    @config.setter
+    def config(self, config: ApplianceConfig) -> None:
+        """Set the appliance configuration and cache its thresholds and timings."""
+        self._config = config
+        self._off = float(config.off_threshold)
+        self._run = float(config.running_threshold)
+        self._power_eps = float(config.power_epsilon)
+        self._debounce_s = float(config.debounce_time)
+        self._complete_timeout_s = float(config.complete_timeout)
+        # New thresholds may move a steady reading to another state
+        self._transition_pending = True
 
     def update_power(self, power: float) -> bool:
         """
@@ -42,128 +194,191 @@ class CustomApplianceStateMachine:
         Returns True if state changed, False otherwise.
         """
         if power < 0:
-            _LOGGER.warning(
-                "Negative power reading %.2fW for appliance %s, ignoring",
-                power,
-                self.config.name,
-            )
+            # Rate limit the warning, a faulty sensor may report this constantly
+            if _LOGGER.isEnabledFor(logging.WARNING):
+                now = time.monotonic()
+                if now - self._last_neg_warn_mono >= _NEGATIVE_POWER_WARN_INTERVAL:
+                    self._last_neg_warn_mono = now
+                    _LOGGER.warning(
+                        "Negative power reading %.2fW for appliance %s, ignoring",
+                        power,
+                        self.config.name,
+                    )
             return False
 
-        self.last_power_reading = power
-        self.last_power_update = datetime.now()
-
-        new_state = self._determine_state_from_power(power)
-        return self._transition_to_state(new_state)
+        now = time.monotonic()
 
-    def _determine_state_from_power(self, power: float) -> ApplianceState:
-        """Determine what state the appliance should be in based on power."""
-        if power <= self.config.off_threshold:
-            return ApplianceState.OFF
-        if power >= self.config.running_threshold:
-            return ApplianceState.RUNNING
-        # Power is between off and running thresholds
-        # If we were running and now in this range, check for completion
+        # Skip readings that barely changed unless they cross a threshold or
+        # a transition may be due
         if (
-            self.current_state == ApplianceState.RUNNING
-            and self._time_in_current_state()
-            >= timedelta(seconds=self.config.debounce_time)
+            abs(power - self.last_power_reading) < self._power_eps
+            and self._power_band(power) == self._power_band(self.last_power_reading)
+            and not self.transition_may_be_due
         ):
-            return ApplianceState.COMPLETE
-        if self.current_state == ApplianceState.COMPLETE:
-            # Stay in complete state for the timeout period
-            if self._time_in_current_state() >= timedelta(
-                seconds=self.config.complete_timeout
-            ):
-                return ApplianceState.IDLE
-            return ApplianceState.COMPLETE
-        return ApplianceState.IDLE
-
-    def _transition_to_state(self, new_state: ApplianceState) -> bool:
-        """Transition to new state if conditions are met."""
-        if new_state == self.current_state:
+            self._last_power_update_mono = now
             return False
 
-        # Check debounce time for state transitions
-        time_in_state = self._time_in_current_state()
-        if time_in_state < timedelta(seconds=self.config.debounce_time):
-            # Not enough time in current state, don't transition yet
-            # Exception: immediate transition to RUNNING (appliance turned on)
-            if new_state != ApplianceState.RUNNING:
-                return False
+        if power != self.last_power_reading:
+            self.last_power_reading = power
+            self._cache_dirty = True
+        self._last_power_update_mono = now
 
-        # Special case: RUNNING to COMPLETE transition
+        new_state = self._determine_state_from_power(power, now)
+        if new_state is self.current_state:
+            self._transition_pending = False
+            return False
+
+        # Not enough time in current state, don't transition yet
+        # Exception: immediate transition to RUNNING (appliance turned on)
         if (
-            self.current_state == ApplianceState.RUNNING
-            and new_state == ApplianceState.COMPLETE
+            new_state is not ApplianceState.RUNNING
+            and self._time_in_current_state(now) < self._debounce_s
         ):
-            # Allow immediate transition to COMPLETE when power drops from RUNNING
-            pass
+            self._transition_pending = True
+            return False
 
-        # Perform the transition
+        self._do_transition(new_state, now)
+        return True
+
+    def _power_band(self, power: float) -> int:
+        """Return 0 at or below the off threshold, 2 at or above running, else 1."""
+        if power <= self._off:
+            return 0
+        if power >= self._run:
+            return 2
+        return 1
+
+    def _determine_state_from_power(
+        self, power: float, now: float | None = None
+    ) -> ApplianceState:
+        """Determine what state the appliance should be in based on power."""
+        return _next_state(
+            self.current_state,
+            power,
+            self._time_in_current_state(now),
+            self._off,
+            self._run,
+            self._debounce_s,
+            self._complete_timeout_s,
+        )
+
+    def _do_transition(self, new_state: ApplianceState, now: float) -> None:
+        """Transition to a new state, already checked against the debounce."""
+        self._transition_pending = False
         self._previous_state = self.current_state
         self.current_state = new_state
-        self.last_state_change = datetime.now()
-        self.state_entry_time = datetime.now()
-
-        _LOGGER.info(
-            "Appliance %s transitioned from %s to %s (power: %.2fW)",
-            self.config.name,
-            self._previous_state.value,
-            self.current_state.value,
-            self.last_power_reading,
-        )
+        wall_now = datetime.now()
+        self.last_state_change = wall_now
+        self.state_entry_time = wall_now
+        self._state_entry_mono = now
+        self._last_state_change_iso = wall_now.isoformat()
+        self._cache_dirty = True
+        self._cache_state_flags()
 
-        return True
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Appliance %s transitioned from %s to %s (power: %.2fW)",
+                self.config.name,
+                self._previous_state.value,
+                self.current_state.value,
+                self.last_power_reading,
+            )
 
-    def _time_in_current_state(self) -> timedelta:
-        """Get time spent in current state."""
-        return datetime.now() - self.state_entry_time
+    def _cache_state_flags(self) -> None:
+        """Precompute the state name and flags for the current state."""
+        state = self.current_state
+        self._state_name = state.value
+        self._is_running = state is ApplianceState.RUNNING
+        self._is_complete = state is ApplianceState.COMPLETE
+        self._is_off = state is ApplianceState.OFF
+        self._is_idle = state is ApplianceState.IDLE
+
+    def _time_in_current_state(self, now: float | None = None) -> float:
+        """Get time spent in current state in seconds."""
+        if now is None:
+            now = time.monotonic()
+        return now - self._state_entry_mono
+
+    @property
+    def transition_may_be_due(self) -> bool:
+        """Return True if an unchanged power reading may still change state."""
+        return self._transition_pending or self.current_state in _PENDING_TIMEOUT_STATES
 
     @property
     def is_running(self) -> bool:
         """Return True if appliance is currently running."""
-        return self.current_state == ApplianceState.RUNNING
+        return self._is_running
 
     @property
     def is_complete(self) -> bool:
         """Return True if appliance has completed a cycle."""
-        return self.current_state == ApplianceState.COMPLETE
+        return self._is_complete
 
     @property
     def is_off(self) -> bool:
         """Return True if appliance is off."""
-        return self.current_state == ApplianceState.OFF
+        return self._is_off
 
     @property
     def is_idle(self) -> bool:
         """Return True if appliance is idle."""
-        return self.current_state == ApplianceState.IDLE
+        return self._is_idle
 
     @property
     def state_name(self) -> str:
         """Return current state as string."""
-        return self.current_state.value
+        return self._state_name
 
     @property
     def time_in_state_seconds(self) -> int:
         """Return time in current state in seconds."""
-        return int(self._time_in_current_state().total_seconds())
+        return int(self._time_in_current_state())
+
+    @property
+    def last_power_update(self) -> datetime:
+        """Return the wall-clock time of the last power update."""
+        return datetime.now() - timedelta(
+            seconds=time.monotonic() - self._last_power_update_mono
+        )
 
     @property
     def power_consumption(self) -> float:
         """Return current power consumption."""
         return self.last_power_reading
 
-    def get_state_data(self) -> dict[str, any]:
-        """Return state machine data for entities."""
-        return {
-            "state": self.state_name,
-            "power": self.power_consumption,
-            "time_in_state": self.time_in_state_seconds,
-            "is_running": self.is_running,
-            "is_complete": self.is_complete,
-            "is_off": self.is_off,
-            "is_idle": self.is_idle,
-            "last_state_change": self.last_state_change.isoformat(),
-            "last_power_update": self.last_power_update.isoformat(),
+    def _get_last_power_update_iso(self) -> str:
+        """Return last_power_update as ISO string, reformatted at most per second."""
+        if self._last_power_update_mono - self._last_power_update_iso_mono >= 1.0:
+            self._last_power_update_iso = self.last_power_update.isoformat()
+            self._last_power_update_iso_mono = self._last_power_update_mono
+        return self._last_power_update_iso
+
+    def get_state_data(self) -> dict[str, Any]:
+        """
+        Return state machine data for entities.
+
+        The same dict is returned until the state or power reading changes
+        or the time in state ticks over to the next second.
+        """
+        time_in_state = int(self._time_in_current_state())
+        cache = self._state_data_cache
+        if (
+            not self._cache_dirty
+            and cache is not None
+            and cache["time_in_state"] == time_in_state
+        ):
+            return cache
+
+        self._state_data_cache = {
+            "state": self._state_name,
+            "power": self.last_power_reading,
+            "time_in_state": time_in_state,
+            "is_running": self._is_running,
+            "is_complete": self._is_complete,
+            "is_off": self._is_off,
+            "is_idle": self._is_idle,
+            "last_state_change": self._last_state_change_iso,
+            "last_power_update": self._get_last_power_update_iso(),
         }
+        self._cache_dirty = False
+        return self._state_data_cache